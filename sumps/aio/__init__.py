@@ -2,7 +2,7 @@
 
 from .asyncio_support import asyncio_context, asyncio_spawn
 from .kernel import Kernel
-from .queue import IterableQueue, IterableUniversalQueue, iter
+from .queue import SENTINEL, IterableQueue, IterableUniversalQueue, iter
 from .run_in import run_in_process, run_in_thread
 from .signals import TERMINATION_SIGNALS, SignalEvent, SignalHandler, spawn_signals_listener
 from .wrapper import async_wrapper
@@ -14,6 +14,7 @@ __all__ = [
     "iter",
     "IterableQueue",
     "IterableUniversalQueue",
+    "SENTINEL",
     "run_in_process",
     "run_in_thread",
     "async_wrapper",
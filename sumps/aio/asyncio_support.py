@@ -1,59 +1,69 @@
 import asyncio
 import threading
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
 
-import curio
+from curio.traps import _future_wait
 
-__all__ = ["init_asyncio_loop", "asyncio_context", "asyncio_spawn"]
+__all__ = ["init_asyncio_loop", "get_asyncio_loop", "asyncio_context", "asyncio_spawn"]
 
+# asyncio loop started by init_asyncio_loop
+_asyncio_loop: asyncio.AbstractEventLoop | None = None
 
-def init_asyncio_loop():
-    """Boostrap asyncio loop on a dedicated thread."""
 
-    def _asyncio_worker_thread(loop):
-        def _suspended():
-            asyncio.set_event_loop(loop)
-            loop.run_forever()
+def init_asyncio_loop(max_workers: int | None = None):
+    """Boostrap asyncio loop on a dedicated thread.
 
-        return _suspended
+    Args:
+        max_workers (int | None): size of the loop default executor used by `run_in_executor`.
+            Default to None, which keeps the `ThreadPoolExecutor` default (`min(32, os.cpu_count() + 4)`).
+    """
 
-    def _asyncio_thread_terminate(loop, asyncio_thread):
-        def _terminate():
-            loop.call_soon_threadsafe(loop.stop)
-            asyncio_thread.join(timeout=30)
-
-        return _terminate
-
-    _asyncio_loop = asyncio.new_event_loop()
+    global _asyncio_loop
+    loop = _asyncio_loop = asyncio.new_event_loop()
+    executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers else None
+    if executor:
+        loop.set_default_executor(executor)
 
     # define loop in curio/main thread
-    asyncio.set_event_loop(_asyncio_loop)
+    asyncio.set_event_loop(loop)
+
+    def _suspended():
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
 
     # Boot the asyncio worker thread
-    _worker_thread = threading.Thread(target=_asyncio_worker_thread(_asyncio_loop), name="asyncio-worker")
-    _worker_thread.start()
+    worker_thread = threading.Thread(target=_suspended, name="asyncio-worker")
+    worker_thread.start()
+
+    def _terminate():
+        global _asyncio_loop
+        loop.call_soon_threadsafe(loop.stop)
+        worker_thread.join(timeout=30)
+        if executor:
+            # release idle workers, running calls are not waited for
+            executor.shutdown(wait=False, cancel_futures=True)
+        if _asyncio_loop is loop:
+            _asyncio_loop = None
 
-    return _asyncio_thread_terminate(_asyncio_loop, _worker_thread)
+    return _terminate
+
+
+def get_asyncio_loop() -> asyncio.AbstractEventLoop | None:
+    """Returns the asyncio loop started by init_asyncio_loop, if any."""
+    return _asyncio_loop
 
 
 def asyncio_context(callable):
     """Run the target async callable in asyncio context."""
 
     async def run_it(*args):
-        _asyncio_loop = asyncio.get_event_loop()
-        if not _asyncio_loop:
+        _loop = _asyncio_loop or asyncio.get_event_loop()
+        if not _loop:
             raise RuntimeError("Asyncio is not enabled")
 
-        e = curio.UniversalEvent()
-
-        async def _callable():
-            # run in asyncio worker thread
-            result = await callable(*args)
-            await e.set()
-            return result
-
-        future = asyncio.run_coroutine_threadsafe(_callable(), _asyncio_loop)
-        await e.wait()
+        # run in asyncio worker thread, the curio task waits on the future without holding a thread
+        future = asyncio.run_coroutine_threadsafe(callable(*args), _loop)
+        await _future_wait(future)
         return future.result()
 
     return run_it
@@ -61,8 +71,8 @@ def asyncio_context(callable):
 
 async def asyncio_spawn(callable) -> Future:
     """Spawn a task in asyncio context."""
-    _asyncio_loop = asyncio.get_event_loop()
-    if not _asyncio_loop:
+    _loop = _asyncio_loop or asyncio.get_event_loop()
+    if not _loop:
         raise RuntimeError("Asyncio is not enabled")
 
-    return asyncio.run_coroutine_threadsafe(callable, _asyncio_loop)
+    return asyncio.run_coroutine_threadsafe(callable, _loop)
@@ -1,11 +1,12 @@
 """Defines a kernel."""
 
+import asyncio
 from contextlib import ExitStack
 
 from curio import Kernel as _Kernel
 from curio import workers
 
-from .asyncio_support import init_asyncio_loop
+from .asyncio_support import get_asyncio_loop, init_asyncio_loop
 
 __all__ = ["Kernel"]
 
@@ -21,10 +22,12 @@ class Kernel(ExitStack):
         max_threads: int | None = None,
         debug: bool = False,
         with_asyncio: bool = True,
+        max_asyncio_workers: int | None = None,
     ) -> None:
         super().__init__()
         assert max_processes is None or max_processes > 0
         assert max_threads is None or max_threads > 0
+        assert max_asyncio_workers is None or max_asyncio_workers > 0
 
         # configure curio worker
         if max_threads:
@@ -36,8 +39,10 @@ class Kernel(ExitStack):
         self._kernel = self.enter_context(_Kernel(debug=debug))
 
         # add asyncio support
+        self._asyncio_loop = None
         if with_asyncio:
-            self.callback(init_asyncio_loop())
+            self.callback(init_asyncio_loop(max_workers=max_asyncio_workers))
+            self._asyncio_loop = get_asyncio_loop()
 
     @property
     def max_threads(self) -> int:
@@ -47,6 +52,11 @@ class Kernel(ExitStack):
     def max_processes(self) -> int:
         return workers.MAX_WORKER_PROCESSES
 
+    @property
+    def asyncio_loop(self) -> asyncio.AbstractEventLoop | None:
+        """Returns the asyncio loop started with this kernel, if any."""
+        return self._asyncio_loop
+
     def run(self, corofunc=None, *args, shutdown=False):
         """Submit a new task to the kernel."""
         return self._kernel.run(*args, corofunc=corofunc, shutdown=shutdown)
@@ -2,44 +2,96 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import Final
 
 from curio import CancelledError, LifoQueue, PriorityQueue, Queue, UniversalQueue
 from curio.meta import awaitable
 
-__all__ = ["iter", "IterableQueue", "IterableUniversalQueue"]
+__all__ = ["iter", "IterableQueue", "IterableUniversalQueue", "SENTINEL"]
 
 type SimpleQueue = Queue | PriorityQueue | LifoQueue
 
+# default maximum number of items pulled from the queue in one go: no prefetch, several
+# consumers may share a queue and should not take items from each other
+_BATCH_SIZE = 1
 
-def iter(queue: SimpleQueue | UniversalQueue) -> Iterable:
-    if isinstance(queue, UniversalQueue):
-        return IterableUniversalQueue(queue=queue)
-    return IterableQueue(queue=queue)
+SENTINEL: Final = object()
+"""Put SENTINEL on a queue to terminate its iteration."""
 
 
-class IterableQueue(Iterable):
+def iter(queue: SimpleQueue | UniversalQueue, batch_size: int = _BATCH_SIZE) -> IterableQueue | IterableUniversalQueue:
+    if isinstance(queue, UniversalQueue):
+        return IterableUniversalQueue(queue=queue, batch_size=batch_size)
+    return IterableQueue(queue=queue, batch_size=batch_size)
+
+
+async def _fill(queue: SimpleQueue, buffer: deque, batch_size: int) -> None:
+    # wait for one item, then take what is already available without suspending
+    item = await queue.get()
+    await queue.task_done()
+    buffer.append(item)
+    while item is not SENTINEL and not queue.empty() and len(buffer) < batch_size:
+        item = await queue.get()
+        await queue.task_done()
+        buffer.append(item)
+
+
+async def _fill_universal(queue: UniversalQueue, buffer: deque, batch_size: int) -> None:
+    # same as _fill, task_done_sync never blocks and skips the sync/async dispatch of task_done
+    task_done = queue.task_done_sync
+    item = await queue.get()
+    task_done()
+    buffer.append(item)
+    while item is not SENTINEL and not queue.empty() and len(buffer) < batch_size:
+        item = await queue.get()
+        task_done()
+        buffer.append(item)
+
+
+async def _batches(iterable: IterableQueue | IterableUniversalQueue) -> AsyncIterator[list]:
+    buffer = iterable._buffer
+    async for item in iterable:
+        batch = [item]
+        while buffer and buffer[0] is not SENTINEL:
+            batch.append(buffer.popleft())
+        yield batch
+
+
+class IterableQueue(AsyncIterable):
     """Create an Iterable Queue."""
 
-    def __init__(self, queue: SimpleQueue) -> None:
+    __slots__ = ("_halt", "_buffer", "_batch_size", "queue")
+
+    def __init__(self, queue: SimpleQueue, batch_size: int = _BATCH_SIZE) -> None:
+        assert batch_size > 0
         self._halt = False
+        self._buffer: deque = deque()
+        self._batch_size = batch_size
         self.queue = queue
 
     def __aiter__(self):
         return self
 
     async def __anext__(self):
-        if self._halt:
+        # items already pulled from the queue are served before halting
+        if self._halt and not self._buffer:
             raise StopAsyncIteration()
         try:
-            item = await self.queue.get()
-            await self.queue.task_done()
-            if not item:
+            if not self._buffer:
+                await _fill(self.queue, self._buffer, self._batch_size)
+            item = self._buffer.popleft()
+            if item is SENTINEL:
                 raise StopAsyncIteration()
             return item
         except CancelledError as error:
             raise StopAsyncIteration() from error
 
+    def batches(self) -> AsyncIterator[list]:
+        """Iterate over lists of items, each one holding up to batch_size items available in the queue."""
+        return _batches(self)
+
     async def halt(self):
         # halt the next iteration
         self._halt = True
@@ -48,8 +100,13 @@ class IterableQueue(Iterable):
 class IterableUniversalQueue(Iterable):
     """Create an Iterable UniversalQueue."""
 
-    def __init__(self, queue: UniversalQueue) -> None:
+    __slots__ = ("_halt", "_buffer", "_batch_size", "queue")
+
+    def __init__(self, queue: UniversalQueue, batch_size: int = _BATCH_SIZE) -> None:
+        assert batch_size > 0
         self._halt = False
+        self._buffer: deque = deque()
+        self._batch_size = batch_size
         self.queue = queue
 
     def __aiter__(self) -> IterableUniversalQueue:
@@ -59,31 +116,40 @@ class IterableUniversalQueue(Iterable):
         return self
 
     def __next__(self):
-        if self._halt:
+        if self._halt and not self._buffer:
             raise StopIteration()
 
         try:
-            item = self.queue.get()
-            self.queue.task_done_sync()
-            if not item:
-                raise StopAsyncIteration()
+            if self._buffer:
+                item = self._buffer.popleft()
+            else:
+                item = self.queue.get()
+                self.queue.task_done_sync()
+            if item is SENTINEL:
+                raise StopIteration()
             return item
 
         except CancelledError as error:
             raise StopIteration() from error
 
     async def __anext__(self):
-        if self._halt:
+        # items already pulled from the queue are served before halting
+        if self._halt and not self._buffer:
             raise StopAsyncIteration()
         try:
-            item = await self.queue.get()
-            await self.queue.task_done()
-            if not item:
+            if not self._buffer:
+                await _fill_universal(self.queue, self._buffer, self._batch_size)
+            item = self._buffer.popleft()
+            if item is SENTINEL:
                 raise StopAsyncIteration()
             return item
         except CancelledError as error:
             raise StopAsyncIteration() from error
 
+    def batches(self) -> AsyncIterator[list]:
+        """Iterate over lists of items, each one holding up to batch_size items available in the queue."""
+        return _batches(self)
+
     def halt(self):  # type: ignore
         # halt the next iteration
         self._halt = True
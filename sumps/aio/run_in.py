@@ -2,12 +2,25 @@
 
 import contextvars
 import functools
+from multiprocessing.shared_memory import SharedMemory
 
 from curio import run_in_process as _run_in_process
 from curio import run_in_thread as _run_in_thread
+from msgspec import Struct
 
 __all__ = ["run_in_thread", "run_in_process"]
 
+# bytes arguments above this size are sent to worker process through shared memory
+_SHARED_MEMORY_THRESHOLD = 64 * 1024
+
+
+class SharedRef(Struct, frozen=True):
+    """Reference a bytes like argument copied in a shared memory block."""
+
+    name: str
+    size: int
+    kind: type[bytes] | type[bytearray]
+
 
 async def run_in_thread(callable, *args, call_on_cancel=None):
     """
@@ -16,7 +29,7 @@ async def run_in_thread(callable, *args, call_on_cancel=None):
     executed.  If it start running, it will run fully to completion
     as a kind of zombie.
     """
-    return _run_in_thread(_run_in_(callable, *args), call_on_cancel=call_on_cancel)
+    return await _run_in_thread(_run_in_(callable, *args), call_on_cancel=call_on_cancel)
 
 
 async def run_in_process(callable, *args):
@@ -42,11 +55,51 @@ async def run_in_process(callable, *args):
     The worker process is a separate isolated Python interpreter.
     Nothing should be assumed about its global state including shared
     variables, files, or connections.
+
+    Bytes and bytearray arguments larger than 64 KiB are passed through
+    shared memory rather than the pipe.
     """
-    return _run_in_process(_run_in_(callable, *args))
+    blocks: list[SharedMemory] = []
+    try:
+        shared_args = [_share(arg, blocks) for arg in args]
+        # context variables can not be pickled, the worker process starts with its own context
+        if not blocks:
+            return await _run_in_process(callable, *args)
+        return await _run_in_process(_call_with_shared, callable, *shared_args)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _run_in_(callable, *args):
+    # always run in a copy: variables set by callable must not leak into the reused worker thread
+    return functools.partial(contextvars.copy_context().run, callable, *args)
+
+
+def _share(arg, blocks: list[SharedMemory]):
+    kind = type(arg)
+    if (kind is bytes or kind is bytearray) and len(arg) > _SHARED_MEMORY_THRESHOLD:
+        block = SharedMemory(create=True, size=len(arg))
+        blocks.append(block)
+        buf = block.buf
+        assert buf is not None
+        buf[: len(arg)] = arg
+        return SharedRef(name=block.name, size=len(arg), kind=kind)
+    return arg
+
+
+def _call_with_shared(callable, *args):
+    # executed in worker process: copy back shared arguments before the call
+    return callable(*[_resolve(arg) if type(arg) is SharedRef else arg for arg in args])
 
 
-def _run_in_(callable, args=()):
-    ctx = contextvars.copy_context()
-    func_call = functools.partial(ctx.run, callable, *args)
-    return func_call
+def _resolve(ref: SharedRef) -> bytes | bytearray:
+    block = SharedMemory(name=ref.name)
+    try:
+        buf = block.buf
+        assert buf is not None
+        with buf[: ref.size] as view:
+            return ref.kind(view)
+    finally:
+        block.close()
@@ -33,7 +33,9 @@ __all__ = ["SignalEvent", "spawn_signals_listener", "SignalHandler", "TERMINATIO
 
 type SignalHandler = Callable[[], Awaitable[None]]
 
-TERMINATION_SIGNALS: list[signal.Signals] = [signal.SIGQUIT, signal.SIGTERM, signal.SIGINT, signal.SIGHUP]
+TERMINATION_SIGNALS: frozenset[signal.Signals] = frozenset(
+    (signal.SIGQUIT, signal.SIGTERM, signal.SIGINT, signal.SIGHUP)
+)
 
 
 class SignalEvent(UniversalEvent):
@@ -1,3 +1,5 @@
+from functools import wraps
+
 from curio.meta import iscoroutinefunction
 
 __all__ = ["async_wrapper"]
@@ -6,6 +8,7 @@ __all__ = ["async_wrapper"]
 def async_wrapper(target):
     """wrap a sync function into an async one."""
 
+    @wraps(target)
     async def wrapped(*args, **kwds):
         return target(*args, **kwds)
 
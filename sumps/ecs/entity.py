@@ -11,10 +11,11 @@ we could build archetype from scratch.
 from __future__ import annotations
 
 from collections.abc import Iterable
+from functools import cache
 from itertools import count as _count
 from typing import TypeVar, overload
 
-from msgspec import Struct
+from msgspec import Struct, field
 
 from sumps.lang import snake_case
 
@@ -32,15 +33,52 @@ C4 = TypeVar("C4", bound=Component)
 type EntityDefinition = set[type[Component]]
 
 
+@cache
 def qualified_name(c: type[Component]) -> str:
     return snake_case(c.__name__)
 
 
 def component(clzz: Struct):
     """Check, need to register ?"""
+    qualified_name(clzz)
     return clzz
 
 
+class Archetype(Struct):
+    """Store entities sharing the same set of component types.
+
+    Components are kept column wise: the row of an entity is its index in `entities`
+    and in each list of `columns`. Columns are ordered by component qualified name, so
+    that their order does not depend on string hashing.
+    """
+
+    signature: frozenset[str]
+    entities: list[EntityId] = field(default_factory=list)
+    columns: dict[str, list[Component]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.columns = {name: [] for name in sorted(self.signature)}
+
+    def append(self, entity: EntityId, components: dict[str, Component]) -> int:
+        """Add a row and returns its index."""
+        self.entities.append(entity)
+        for name, column in self.columns.items():
+            column.append(components[name])
+        return len(self.entities) - 1
+
+    def swap_remove(self, index: int) -> dict[str, Component]:
+        """Remove a row by moving the last one in its place, and returns removed components."""
+        removed = {}
+        for name, column in self.columns.items():
+            removed[name] = column[index]
+            column[index] = column[-1]
+            column.pop()
+        entities = self.entities
+        entities[index] = entities[-1]
+        entities.pop()
+        return removed
+
+
 class Entity:
     id: EntityId
 
@@ -58,14 +96,60 @@ class EntityHandler(Entity):
     def __getattr__(self, name):
         if self.id in self.manager._dead_entities:
             raise RuntimeError(f"Entity {self.id} is dead.")
-        return self.manager._entities[self.id][name]
+        archetype, index = self.manager._locations[self.id]
+        return archetype.columns[name][index]
 
 
 class EntityManager:
-    _entity_count = _count(start=1)
-    _entities: dict[EntityId, dict[str, Component]] = dict()
-    _components: dict[str, set[EntityId]] = dict()
-    _dead_entities: set[EntityId] = set()
+    _entity_count: _count[EntityId]
+    _archetypes: dict[frozenset[str], Archetype]
+    _archetypes_per_component: dict[str, list[Archetype]]
+    _locations: dict[EntityId, tuple[Archetype, int]]
+    _queries: dict[frozenset[str], list[Archetype]]
+    _dead_entities: set[EntityId]
+
+    def __init__(self) -> None:
+        self._entity_count = _count(start=1)
+        self._archetypes = {}
+        self._archetypes_per_component = {}
+        self._locations = {}
+        self._queries = {}
+        self._dead_entities = set()
+
+    def _archetype(self, signature: frozenset[str]) -> Archetype:
+        archetype = self._archetypes.get(signature)
+        if archetype is None:
+            archetype = self._archetypes[signature] = Archetype(signature=signature)
+            for name in signature:
+                self._archetypes_per_component.setdefault(name, []).append(archetype)
+            self._queries.clear()
+        return archetype
+
+    def _matching(self, signature: frozenset[str]) -> list[Archetype]:
+        """Returns archetypes holding at least all component of signature."""
+        archetypes = self._queries.get(signature)
+        if archetypes is None:
+            if signature:
+                # only scan archetypes of the rarest component
+                per_component = self._archetypes_per_component
+                candidates = min((per_component.get(name, ()) for name in signature), key=len)
+            else:
+                candidates = self._archetypes.values()
+            archetypes = self._queries[signature] = [
+                archetype for archetype in candidates if signature <= archetype.signature
+            ]
+        return archetypes
+
+    def _insert(self, entity: EntityId, components: dict[str, Component]) -> None:
+        archetype = self._archetype(frozenset(components))
+        self._locations[entity] = archetype, archetype.append(entity, components)
+
+    def _remove(self, entity: EntityId) -> dict[str, Component]:
+        archetype, index = self._locations.pop(entity)
+        components = archetype.swap_remove(index)
+        if index < len(archetype.entities):
+            self._locations[archetype.entities[index]] = archetype, index
+        return components
 
     def create_entity(self, *components: Struct) -> EntityId:
         """Create a new Entity, with optional initial Components.
@@ -77,18 +161,9 @@ class EntityManager:
         """
         entity = next(self._entity_count)
 
-        if entity not in self._entities:
-            self._entities[entity] = {}
-
-        for component_instance in components:
-            component_type = qualified_name(type(component_instance))
-
-            if component_type not in self._components:
-                self._components[component_type] = set()
-
-            self._components[component_type].add(entity)
-
-            self._entities[entity][component_type] = component_instance
+        self._insert(
+            entity, {qualified_name(type(component_instance)): component_instance for component_instance in components}
+        )
 
         return entity
 
@@ -108,13 +183,7 @@ class EntityManager:
         Raises a KeyError if the given entity does not exist in the database.
         """
         if immediate:
-            for component_type in self._entities[entity]:
-                self._components[component_type].discard(entity)
-
-                if not self._components[component_type]:
-                    del self._components[component_type]
-
-            del self._entities[entity]
+            self._remove(entity)
 
         else:
             self._dead_entities.add(entity)
@@ -125,7 +194,7 @@ class EntityManager:
         Empty Entities (with no components) and dead Entities (destroyed
         by delete_entity) will not count as existent ones.
         """
-        return entity in self._entities and entity not in self._dead_entities
+        return entity in self._locations and entity not in self._dead_entities
 
     def component_for_entity(self, entity: EntityId, component_type: type[Component]) -> Component:
         """Retrieve a Component instance for a specific Entity.
@@ -136,7 +205,8 @@ class EntityManager:
 
         Raises a KeyError if the given Entity and Component do not exist.
         """
-        return self._entities[entity][qualified_name(component_type)]
+        archetype, index = self._locations[entity]
+        return archetype.columns[qualified_name(component_type)][index]
 
     def components_for_entity(self, entity: EntityId) -> tuple[Component, ...]:
         """Retrieve all Components for a specific Entity, as a Tuple.
@@ -146,19 +216,20 @@ class EntityManager:
         saving state, or passing specific Components between World contexts.
         Unlike most other functions, this returns all the Components as a
         Tuple in one batch, instead of returning a Generator for iteration.
+        Components are ordered by their qualified name.
 
         Raises a KeyError if the given entity does not exist in the database.
         """
-        return tuple(self._entities[entity].values())
+        archetype, index = self._locations[entity]
+        return tuple(column[index] for column in archetype.columns.values())
 
     def has_component(self, entity: EntityId, component_type: type[Component]) -> bool:
         """Check if an Entity has a specific Component type."""
-        return qualified_name(component_type) in self._entities[entity]
+        return qualified_name(component_type) in self._locations[entity][0].signature
 
     def has_components(self, entity: EntityId, *component_types: type[Component]) -> bool:
         """Check if an Entity has all the specified Component types."""
-        components_dict = self._entities[entity]
-        return all(comp_type in components_dict for comp_type in component_types)
+        return self._locations[entity][0].signature.issuperset(map(qualified_name, component_types))
 
     def add_component(
         self, entity: EntityId, component_instance: Component, type_alias: type[Component] | None = None
@@ -174,12 +245,14 @@ class EntityManager:
         """
         component_type = qualified_name(type_alias or type(component_instance))
 
-        if component_type not in self._components:
-            self._components[component_type] = set()
-
-        self._components[component_type].add(entity)
+        archetype, index = self._locations[entity]
+        if component_type in archetype.signature:
+            archetype.columns[component_type][index] = component_instance
+            return
 
-        self._entities[entity][component_type] = component_instance
+        components = self._remove(entity)
+        components[component_type] = component_instance
+        self._insert(entity, components)
 
     def remove_component(self, entity: EntityId, component_type: type[Component]) -> Component:
         """Remove a Component instance from an Entity, by type.
@@ -192,21 +265,27 @@ class EntityManager:
         not exist in the database.
         """
         component_type_id = qualified_name(component_type)
-        self._components[component_type_id].discard(entity)
 
-        if not self._components[component_type_id]:
-            del self._components[component_type_id]
+        if component_type_id not in self._locations[entity][0].signature:
+            raise KeyError(component_type_id)
 
-        return self._entities[entity].pop(component_type_id)  # type: ignore[no-any-return]
+        components = self._remove(entity)
+        component_instance = components.pop(component_type_id)
+        self._insert(entity, components)
+        return component_instance
 
     def get_component(self, component_type: type[Component]) -> Iterable[tuple[EntityId, Component]]:
         """Get an iterator for Entity, Component pairs."""
-        entity_db = self._entities
-
         component_type_id = qualified_name(component_type)
 
-        for entity in self._components.get(component_type_id, []):
-            yield entity, entity_db[entity][component_type_id]
+        # rows are gathered before yielding: adding or removing components while iterating moves entities
+        # between archetypes, which would otherwise skip or repeat them
+        rows = [
+            row
+            for archetype in self._matching(frozenset((component_type_id,)))
+            for row in zip(archetype.entities, archetype.columns[component_type_id], strict=True)
+        ]
+        yield from rows
 
     @overload
     def get_components(self, c1: type[C1]) -> Iterable[tuple[EntityId, tuple[C1]]]: ...
@@ -225,16 +304,19 @@ class EntityManager:
     ) -> Iterable[tuple[EntityId, tuple[C1, C2, C3, C4]]]: ...
 
     def get_components(self, *component_types: type[Component]) -> Iterable[tuple[EntityId, tuple[Component, ...]]]:  # type: ignore
-        entity_db = self._entities
-        comp_db = self._components
-
         component_type_ids = [qualified_name(ct) for ct in component_types]
 
-        try:
-            for entity in set.intersection(*[comp_db[ct] for ct in component_type_ids]):
-                yield entity, tuple(entity_db[entity][ct] for ct in component_type_ids)
-        except KeyError:
-            pass
+        # gathered before yielding, see get_component
+        rows = [
+            row
+            for archetype in self._matching(frozenset(component_type_ids))
+            for row in zip(
+                archetype.entities,
+                zip(*[archetype.columns[ct] for ct in component_type_ids], strict=True),
+                strict=True,
+            )
+        ]
+        yield from rows
 
     def try_component(self, entity: EntityId, component_type: type[Component]) -> Component | None:
         """Try to get a single component type for an Entity.
@@ -244,8 +326,10 @@ class EntityManager:
         that may or may not exist, without having to first query if the Entity
         has the Component type.
         """
-        if component_type in self._entities[entity]:
-            return self._entities[entity][component_type]
+        archetype, index = self._locations[entity]
+        column = archetype.columns.get(qualified_name(component_type))
+        if column is not None:
+            return column[index]
         return None
 
     @overload
@@ -272,8 +356,11 @@ class EntityManager:
         that may or may not exist, without first having to query if the Entity
         has the Component types.
         """
-        if all(comp_type in self._entities[entity] for comp_type in component_types):
-            return tuple(self._entities[entity][qualified_name(comp_type)] for comp_type in component_types)
+        archetype, index = self._locations[entity]
+        component_type_ids = list(map(qualified_name, component_types))
+        if archetype.signature.issuperset(component_type_ids):
+            columns = archetype.columns
+            return tuple(columns[ct][index] for ct in component_type_ids)
         return None
 
     def clear_dead_entities(self) -> None:
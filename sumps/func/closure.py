@@ -1,7 +1,7 @@
 """Closure module."""
 
 from collections.abc import Callable
-from functools import wraps
+from functools import partial, update_wrapper, wraps
 
 from curio.meta import iscoroutinefunction
 
@@ -57,21 +57,13 @@ def closure(decorated: Callable):
 
         @wraps(decorated)
         def awrapper(*args, **kwargs):
-            @wraps(decorated)
-            def _fn():
-                return decorated(*args, **kwargs)
-
-            return _fn
+            return update_wrapper(partial(decorated, *args, **kwargs), decorated)
 
         return awrapper
 
-    # return an async wrapper
+    # return an async wrapper, the partial itself returns a coroutine when called
     @wraps(decorated)
     async def wrapper(*args, **kwargs):
-        @wraps(decorated)
-        async def _fn():
-            return await decorated(*args, **kwargs)
-
-        return _fn
+        return update_wrapper(partial(decorated, *args, **kwargs), decorated)
 
     return wrapper
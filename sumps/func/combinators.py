@@ -145,3 +145,25 @@ def z_fixed_point(g):
     ```
     """
     return (lambda rec: g(lambda y: rec(rec)(y)))(lambda rec: g(lambda y: rec(rec)(y)))
+
+
+def memoized_z_fixed_point(g):
+    """
+    Same as z_fixed_point, but each result is computed once per argument.
+    Arguments must be hashable.
+
+    example:
+    ```
+    fib = memoized_z_fixed_point(lambda rec: lambda n: n if n < 2 else rec(n - 1) + rec(n - 2))
+    ```
+    """
+    cache = {}
+
+    def rec(y):
+        if y in cache:
+            return cache[y]
+        value = cache[y] = step(y)
+        return value
+
+    step = g(rec)
+    return rec
@@ -1,16 +1,37 @@
 """Compose implements function composition."""
 
-from asyncio import iscoroutinefunction
 from collections.abc import Callable
-from inspect import signature
+from functools import cached_property, lru_cache
+from inspect import Parameter, Signature, signature
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Any
+
+from curio.meta import iscoroutinefunction
 
 from sumps.aio.wrapper import async_wrapper
-from sumps.lang.symbols import FunctionStatement, Module
 
 from .identity import identity
 
 __all__ = ["compose", "pipe"]
 
+# how a parameter is forwarded to the first function of a composition
+_ARGUMENT_FORMATS = {
+    Parameter.POSITIONAL_ONLY: "{0}",
+    Parameter.POSITIONAL_OR_KEYWORD: "{0}",
+    Parameter.VAR_POSITIONAL: "*{0}",
+    Parameter.KEYWORD_ONLY: "{0}={0}",
+    Parameter.VAR_KEYWORD: "**{0}",
+}
+
+
+class _Source(str):
+    """String rendered as is by repr, used to declare default values by name."""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return str(self)
+
 
 class Compose:
     """Compose function calls and compile the resulting function."""
@@ -20,13 +41,23 @@ class Compose:
         self.first = funcs[0]
         self.funcs = funcs[1:]
 
+    # signatures are resolved on first use (a call does not need them), compile and __signature__ reuse them
+    @cached_property
+    def _signature(self) -> Signature:
+        last = self.funcs[-1] if self.funcs else self.first
+        return signature(self.first).replace(return_annotation=signature(last).return_annotation)
+
+    @cached_property
+    def _first_arguments(self) -> str:
+        return ", ".join(
+            [_ARGUMENT_FORMATS[param.kind].format(param.name) for param in self._signature.parameters.values()]
+        )
+
     def __hash__(self):
         return hash(self.first) ^ hash(self.funcs)
 
     def __signature__(self):
-        base = signature(self.first)
-        last = signature(self.funcs[-1])
-        return base.replace(return_annotation=last.return_annotation)
+        return self._signature
 
     def __repr__(self):
         return str(self.__signature__())
@@ -45,32 +76,31 @@ class Compose:
     def compile(self) -> Callable:
         """Compile compose expression."""
 
-        _locals = {}
-        # we cant use specification.add_symbol due to local function definition (inner function instance)
-        # module.specification.add_symbol(qualified_name= qualified_function_name( self.first))
-        _locals[self.first.__name__] = self.first
-        for f in self.funcs:
-            # module.specification.add_symbol(qualified_name=qualified_function_name(f ))
-            _locals[f.__name__] = f
+        # functions are bound to generated names: their own may collide or not be identifiers (lambda, partial)
+        namespace: dict[str, Any] = {f"_f{index}": f for index, f in enumerate((self.first, *self.funcs))}
 
-        is_async = isinstance(self, AsyncCompose)
-        function = FunctionStatement(name="compose", is_async=is_async)
-        function.set_signature(self.__signature__())
+        # declare the first function parameters, defaults are referenced from namespace
+        parameters = []
+        for index, param in enumerate(self._signature.parameters.values()):
+            default = param.default
+            if default is not Parameter.empty:
+                default = _Source(f"_d{index}")
+                namespace[default] = param.default
+            parameters.append(param.replace(annotation=Parameter.empty, default=default))
 
+        is_async = isinstance(self, AsyncCompose)
         pre_call = "await " if is_async else ""
-        body = (
-            f"{pre_call}{self.first.__name__}("
-            + ", ".join([f"{param.name} = {param.name}" for param in signature(self.first).parameters.values()])
-            + ")"
-        )
-        for f in self.funcs:
-            param = next(iter(signature(f).parameters.values()))
-            body = f"{pre_call}{f.__name__}({param.name} = {body})"
-        body = f"\treturn {body}"
+        # chained functions receive the previous result as their only positional argument
+        body = f"{pre_call}_f0({self._first_arguments})"
+        for index in range(1, len(self.funcs) + 1):
+            body = f"{pre_call}_f{index}({body})"
 
-        function.body = body
+        prelude = "async def" if is_async else "def"
+        exec(f"{prelude} compose{Signature(parameters)}:\n    return {body}\n", namespace)
 
-        return function.register(module=Module(name="composer")).import_module(locals=_locals)[function.name]
+        function = namespace["compose"]
+        function.__signature__ = self._signature
+        return function
 
 
 class AsyncCompose(Compose):
@@ -89,6 +119,31 @@ class AsyncCompose(Compose):
         return NotImplemented
 
 
+def _chain(funcs) -> Callable:
+    # a closure is far cheaper to build than compiled code for short compositions
+    match funcs:
+        case (f1, f2):
+
+            def composed(*args, **kwargs):
+                return f1(f2(*args, **kwargs))
+
+        case (f1, f2, f3):
+
+            def composed(*args, **kwargs):
+                return f1(f2(f3(*args, **kwargs)))
+
+        case (f1, f2, f3, f4):
+
+            def composed(*args, **kwargs):
+                return f1(f2(f3(f4(*args, **kwargs))))
+
+        case _:
+            raise ValueError(f"can not chain {len(funcs)} functions")
+
+    composed.__signature__ = signature(funcs[-1]).replace(return_annotation=signature(funcs[0]).return_annotation)  # type: ignore
+    return composed
+
+
 def compose(*funcs):
     """
     Compose functions (async or sync) to operate in series.
@@ -98,15 +153,35 @@ def compose(*funcs):
     ``compose(f, g, h)(x, y)`` is the same as ``f(g(h(x, y)))``.
 
     If no arguments are provided, the identity function (f(x) = x) is returned.
+
+    Compositions of plain functions and builtins are cached: the same function object is
+    returned to every caller (attributes set on it are shared), and the cache keeps up to
+    256 compositions alive with their functions. Other callables (bound methods, partials,
+    ...) are composed on each call, so that their instances are not kept alive.
     """
     if not funcs:
         return identity
     if len(funcs) == 1:
         return funcs[0]
-    else:
-        if any([iscoroutinefunction(f) for f in funcs]):
-            return AsyncCompose(funcs).compile()
-        return Compose(funcs).compile()
+    if all(map(_cacheable, funcs)):
+        return _compose(funcs)
+    return _compose.__wrapped__(funcs)
+
+
+def _cacheable(func) -> bool:
+    kind = type(func)
+    return kind is FunctionType or (kind is BuiltinFunctionType and isinstance(func.__self__, ModuleType))
+
+
+@lru_cache(maxsize=256)
+def _compose(funcs: tuple) -> Callable:
+    # keyed on the functions themselves (identity hash), the cache keeps them alive
+    # so a key can not be reused by another object
+    if any(map(iscoroutinefunction, funcs)):
+        return AsyncCompose(funcs).compile()
+    if len(funcs) <= 4:
+        return _chain(funcs)
+    return Compose(funcs).compile()
 
 
 def pipe(*funcs):
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from functools import wraps
-from inspect import signature
+from inspect import CO_VARARGS, CO_VARKEYWORDS, signature, unwrap
+from types import FunctionType
 from typing import TypeVar, overload
 
 __all__ = ["curried"]
@@ -63,8 +64,22 @@ def curried(
     raise Exception()
 
 
+def _parameters_count(func: Callable) -> int:
+    """Return the number of parameters of func, reading its code object when possible."""
+    target = unwrap(func, stop=lambda f: hasattr(f, "__signature__"))
+    if not isinstance(target, FunctionType) or hasattr(target, "__signature__"):
+        return len(signature(func).parameters)
+    code = target.__code__
+    return (
+        code.co_argcount
+        + code.co_kwonlyargcount
+        + bool(code.co_flags & CO_VARARGS)
+        + bool(code.co_flags & CO_VARKEYWORDS)
+    )
+
+
 def curried(func):  # type: ignore
-    args_len = len(signature(func).parameters)
+    args_len = _parameters_count(func)
 
     if args_len <= 1:
         return func
@@ -74,17 +89,13 @@ def curried(func):  # type: ignore
 
     @wraps(func)
     def curried_function(*args, **keywords):
-        _args = args
-        _keywords = keywords
-
-        if len(_args) + len(_keywords) >= args_len:
-            return func(*_args, **_keywords)
+        if len(args) + len(keywords) >= args_len:
+            return func(*args, **keywords)
 
-        def inner(*args, **keywords):
-            nonlocal _args, _keywords
-            local_args = _args + args
-            local_keywords = {**_keywords, **keywords}
-            return curried_function(*local_args, **local_keywords)
+        def inner(*more_args, **more_keywords):
+            if not keywords and not more_keywords:
+                return curried_function(*args, *more_args)
+            return curried_function(*args, *more_args, **{**keywords, **more_keywords})
 
         return inner
 
@@ -32,8 +32,9 @@ class Dictionary(Struct, Generic[NamedItem]):
             raise RuntimeError("Frozen instance")
         self._items[item.name] = item
 
-    def all(self) -> Iterable[NamedItem]:
-        yield from [s for s in self._items.values()]
+    def all(self) -> tuple[NamedItem, ...]:
+        """Returns a snapshot of all items."""
+        return tuple(self._items.values())
 
     def filter(self, visibility: Visibility) -> Iterable[NamedItem]:
         """Filter item accoding visbility naming convention."""
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import re
+import sys
 from importlib import import_module
 from inspect import Parameter as _Parameter
-from inspect import Signature, _ParameterKind
+from inspect import Signature, _ParameterKind, formatannotation
 from io import StringIO, TextIOBase
+from operator import attrgetter, methodcaller
 from typing import Any, Literal
 
 from msgspec import Struct, field
@@ -27,6 +29,21 @@ __all__ = [
     "Encoder",
 ]
 
+_ANNOTATION_PATTERN = re.compile("'([^']*)'")
+
+_get_module = attrgetter("module")
+_get_module_and_name = attrgetter("module", "name")
+_get_qualified_name = methodcaller("qualified_name")
+
+
+def _caches(struct: Struct) -> dict[str, Any]:
+    """Returns the caches of a struct declared with dict=True.
+
+    Caches live in the instance __dict__ rather than in struct fields, so that they are
+    neither encoded nor compared.
+    """
+    return vars(struct)
+
 
 class Symbol(Struct):
     name: str
@@ -39,10 +56,8 @@ class Symbol(Struct):
 
     @classmethod
     def from_qualified_name(cls, name: str) -> Symbol:
-        index = name.rfind(".")
-        if index < 0:
-            return Symbol(name=name)
-        return Symbol(name=name[index + 1 :], module=name[0:index])
+        module, sep, short_name = name.rpartition(".")
+        return Symbol(name=short_name, module=module) if sep else Symbol(name=name)
 
     def qualified_name(self) -> str:
         return f"{self.module}.{self.name}"
@@ -55,20 +70,17 @@ class Symbol(Struct):
 
 
 class Symbols(Dictionary[Symbol]):
-    def group_per_module(self) -> dict[str, str]:
-        grouped_dict = {}
-        for symbol in self.all():
-            if symbol.module not in grouped_dict:
-                grouped_dict[symbol.module] = [symbol.name]
-            else:
-                grouped_dict[symbol.module].append(symbol.name)
+    def group_per_module(self) -> dict[str | None, list[str]]:
+        grouped_dict: dict[str | None, list[str]] = {}
+        for module, name in map(_get_module_and_name, self.all()):
+            grouped_dict.setdefault(module, []).append(name)
         return grouped_dict
 
 
 type StatementType = Literal["parameter", "variable", "function", "class"]
 
 
-class Statement(Symbol, kw_only=True):
+class Statement(Symbol, kw_only=True, dict=True):
     body: str = ""
     type: StatementType | None = None
     _module: Module | None = None
@@ -76,6 +88,20 @@ class Statement(Symbol, kw_only=True):
     def encode(self, output: Encoder):
         output.comment(f"name: {self.name}").comment(f"kind: {self.type}").write_lines(self.body).cr().cr()
 
+    def _render_key(self) -> Any:
+        return (self.name, self.type, self.body)
+
+    def render(self) -> str:
+        """Returns encoded statement (cached until it changes)."""
+        key = self._render_key()
+        caches = _caches(self)
+        rendered = caches.get("_rendered")
+        if rendered is None or rendered[0] != key:
+            encoder = Encoder.encoder()
+            self.encode(output=encoder)
+            rendered = caches["_rendered"] = (key, encoder.getvalue())
+        return rendered[1]
+
     def register(self, module: Module) -> Module:
         """Register this statement."""
         if self._module:
@@ -89,15 +115,21 @@ class Statement(Symbol, kw_only=True):
         return module
 
 
-type ParameterKind = Literal["positional-only", "positional or keyword", "keyword-only"]
+type ParameterKind = Literal[
+    "positional-only", "positional or keyword", "variadic positional", "keyword-only", "variadic keyword"
+]
 
 
 def _kind_of_parameter(kind) -> ParameterKind:
     match kind:
         case _Parameter.POSITIONAL_ONLY:
             return "positional-only"
+        case _Parameter.VAR_POSITIONAL:
+            return "variadic positional"
         case _Parameter.KEYWORD_ONLY:
             return "keyword-only"
+        case _Parameter.VAR_KEYWORD:
+            return "variadic keyword"
         case _:
             return "positional or keyword"
 
@@ -106,12 +138,19 @@ def _parameter_of_kind(kind: ParameterKind) -> _ParameterKind:
     match kind:
         case "positional-only":
             return _Parameter.POSITIONAL_ONLY
+        case "variadic positional":
+            return _Parameter.VAR_POSITIONAL
         case "keyword-only":
             return _Parameter.KEYWORD_ONLY
+        case "variadic keyword":
+            return _Parameter.VAR_KEYWORD
         case _:
             return _Parameter.POSITIONAL_OR_KEYWORD
 
 
+_PARAMETER_PREFIXES: dict[str, str] = {"variadic positional": "*", "variadic keyword": "**"}
+
+
 class Parameter(Symbol, kw_only=True):
     default: Any = None
     kind: ParameterKind = "positional or keyword"
@@ -142,13 +181,21 @@ class FunctionStatement(Statement, kw_only=True, tag=True, tag_field="_class"):
         return self
 
     def signature(self) -> Signature:
-        return Signature(
-            parameters=[
-                _Parameter(name=p.name, kind=_parameter_of_kind(p.kind), annotation=p.annotation, default=p.default)
-                for p in self.parameters.all()
-            ],
-            return_annotation=self.annotation,
-        )
+        """Returns signature of this function (cached until parameters or annotation change)."""
+        parameters = self.parameters.all()
+        key = (self.annotation, self._parameters_key(parameters))
+        caches = _caches(self)
+        cached = caches.get("_signature")
+        if cached is None or cached[0] != key:
+            signature = Signature(
+                parameters=[
+                    _Parameter(name=p.name, kind=_parameter_of_kind(p.kind), annotation=p.annotation, default=p.default)
+                    for p in parameters
+                ],
+                return_annotation=self.annotation,
+            )
+            cached = caches["_signature"] = (key, signature)
+        return cached[1]
 
     def set_signature(self, sign: Signature):
         self.annotation = sign.return_annotation
@@ -159,11 +206,52 @@ class FunctionStatement(Statement, kw_only=True, tag=True, tag_field="_class"):
             )
 
     def __repr__(self):
-        return f"{self.qualified_name()}{str(self.signature())}"
+        return f"{self.qualified_name()}{self._format_signature()}"
+
+    def _format_signature(self) -> str:
+        """Format signature like str(self.signature()) without building an inspect.Signature."""
+        result = []
+        render_pos_only_separator = False
+        render_kw_only_separator = True
+        for p in self.parameters.all():
+            if p.kind == "positional-only":
+                render_pos_only_separator = True
+            elif render_pos_only_separator:
+                result.append("/")
+                render_pos_only_separator = False
+            if p.kind == "variadic positional":
+                render_kw_only_separator = False
+            elif p.kind == "keyword-only" and render_kw_only_separator:
+                result.append("*")
+                render_kw_only_separator = False
+
+            formatted = _PARAMETER_PREFIXES.get(p.kind, "") + p.name
+            if p.annotation is not _Parameter.empty:
+                formatted = f"{formatted}: {formatannotation(p.annotation)}"
+            if p.default is not _Parameter.empty:
+                separator = "=" if p.annotation is _Parameter.empty else " = "
+                formatted = f"{formatted}{separator}{p.default!r}"
+            result.append(formatted)
+
+        if render_pos_only_separator:
+            result.append("/")
+
+        rendered = f"({', '.join(result)})"
+        if self.annotation is not Signature.empty:
+            rendered = f"{rendered} -> {formatannotation(self.annotation)}"
+        return rendered
+
+    @staticmethod
+    def _parameters_key(parameters: tuple[Parameter, ...]) -> tuple:
+        # snapshot of parameter values, parameters may be changed in place
+        return tuple((p.name, p.kind, p.annotation, p.default) for p in parameters)
+
+    def _render_key(self) -> Any:
+        return (self.name, self.body, self.is_async, self.annotation, self._parameters_key(self.parameters.all()))
 
     def encode(self, output: Encoder):
         prelude = "async def" if self.is_async else "def"
-        output.comment(self.name).write(f"{prelude} {self.name}{self.signature()}:").indent().write_lines(
+        output.comment(self.name).write(f"{prelude} {self.name}{self._format_signature()}:").indent().write_lines(
             body=self.body
         ).outdent().cr().cr()
 
@@ -176,83 +264,109 @@ class FunctionStatement(Statement, kw_only=True, tag=True, tag_field="_class"):
         module = super().register(module=module)
 
         builtin_type_names = get_builtin_type_names()
+        add_symbol = module.specification.add_symbol
 
         def _analyze_annotation(annotation):
-            s = re.findall("'([^']*)'", repr(annotation))
-            if len(s) > 0:
-                _qualified_name = s[0]
+            if annotation is None or annotation is Signature.empty:
+                return
+            if isinstance(annotation, type):
+                if annotation.__module__ != "builtins":
+                    add_symbol(qualified_name=f"{annotation.__module__}.{annotation.__qualname__}")
+                return
+            # typing constructs and string annotations
+            for _qualified_name in _ANNOTATION_PATTERN.findall(repr(annotation)):
                 if _qualified_name not in builtin_type_names:
-                    module.specification.add_symbol(qualified_name=_qualified_name)
-
-        signature = self.signature()
+                    add_symbol(qualified_name=_qualified_name)
 
         # import type of parameters
-        for param in signature.parameters:
-            _analyze_annotation(signature.parameters[param].annotation)
+        for param in self.parameters.all():
+            _analyze_annotation(param.annotation)
 
         # import return type
-        if signature.return_annotation != Signature.empty:
-            _analyze_annotation(signature.return_annotation)
+        _analyze_annotation(self.annotation)
 
         return module
 
 
 class Statements(Dictionary[Statement]):
     def encode(self, output: Encoder):
-        for statement in self.all():
-            statement.encode(output=output)
+        output.write_text("".join(statement.render() for statement in self.all()))
 
 
-class ModuleSpecification(Struct):
+class ModuleSpecification(Struct, dict=True):
     modules: Symbols = field(default_factory=factory(Symbols))
     symbols: Symbols = field(default_factory=factory(Symbols))
-
-    def __post_init__(self):
-        self.add_symbol(qualified_name="__future__.annotations")
-
-    def get_all_modules(self) -> set[str]:
-        """Returns all specified modules."""
-        return {m.qualified_name() for m in self.modules.all()}.union(
-            {m.module for m in self.symbols.all() if m.module}
-        )
+    future_imports: list[str] = field(default_factory=lambda: ["annotations"])
+
+    def get_all_modules(self) -> frozenset[str]:
+        """Returns all specified modules (cached until a module or symbol is added)."""
+        caches = _caches(self)
+        all_modules = caches.get("_all_modules")
+        if all_modules is None:
+            all_modules = caches["_all_modules"] = frozenset(map(_get_qualified_name, self.modules.all())).union(
+                filter(None, map(_get_module, self.symbols.all()))
+            )
+        return all_modules
 
     def add_module(self, qualified_name: str) -> ModuleSpecification:
         self.modules.add(Symbol.from_qualified_name(name=qualified_name))
+        _caches(self).pop("_all_modules", None)
         return self
 
     def add_symbol(self, qualified_name: str) -> ModuleSpecification:
         symbol = Symbol.from_qualified_name(name=qualified_name)
         if not symbol.module:
             raise RuntimeError(f"{symbol} is not a qualified symbol")
+        return self.add_reference(symbol=symbol)
+
+    def add_reference(self, symbol: Symbol) -> ModuleSpecification:
+        """Add a symbol reference."""
         self.symbols.add(symbol)
+        _caches(self).pop("_all_modules", None)
         return self
 
     def exists(self, name: str) -> bool:
         return self.modules.exists(name=name) or self.symbols.exists(name=name)
 
     def encode(self, output: Encoder):
+        # future statements must come first
+        lines = [f"from __future__ import {', '.join(self.future_imports)}"] if self.future_imports else []
+
         # import module
-        for m in self.modules.all():
-            output.write(f"import {m.qualified_name()}")
+        lines.extend(f"import {m.qualified_name()}" for m in self.modules.all())
 
         # import symbols
         for key, value in self.symbols.group_per_module().items():
             if len(value) > 1:
-                output.write(f"from {key} import ({','.join(value)})")
+                lines.append(f"from {key} import ({','.join(value)})")
             else:
-                output.write(f"from {key} import {value[0]}")
+                lines.append(f"from {key} import {value[0]}")
 
+        if lines:
+            output.write_lines("\n".join(lines))
         output.cr()
 
 
-class Module(Symbol, kw_only=True):
+class Module(Symbol, kw_only=True, dict=True):
     specification: ModuleSpecification = field(default_factory=factory(ModuleSpecification))
     statements: Statements = field(default_factory=factory(Statements))
 
     def encodes(self) -> str:
-        encoder = Encoder.encoder()
-        self.encode(output=encoder)
-        return encoder.getvalue()
+        """Returns source code of this module (cached until it changes)."""
+        key = (
+            self.name,
+            tuple(self.specification.future_imports),
+            self.specification.modules.all(),
+            self.specification.symbols.all(),
+            tuple(statement.render() for statement in self.statements.all()),
+        )
+        caches = _caches(self)
+        source = caches.get("_source")
+        if source is None or source[0] != key:
+            encoder = Encoder.encoder()
+            self.encode(output=encoder)
+            source = caches["_source"] = (key, encoder.getvalue())
+        return source[1]
 
     def encode(self, output: Encoder):
         output.comment(f"name: {self.name}")
@@ -271,7 +385,7 @@ class Module(Symbol, kw_only=True):
         """Add a class reference."""
         module = cls.__module__
         if module != "builtins":
-            self.specification.symbols.add(item=Symbol(name=cls.__qualname__, module=module))
+            self.specification.add_reference(symbol=Symbol(name=cls.__qualname__, module=module))
 
     # def add_function(self, function: FunctionStatement):
     #     """Add a function statement.
@@ -303,17 +417,10 @@ class Module(Symbol, kw_only=True):
     def import_module(self, locals: dict[str, Any] | None = None) -> dict[str, Any]:
         """Import this module."""
 
+        modules, symbols = self._import_environment()
+
         # prepare global definition
-        _global = {**globals()}
-        for module_name in self.specification.get_all_modules():
-            # import target module
-            m = import_module(module_name)
-            _global[module_name] = m
-            # import root module
-            if "." in module_name:
-                root_module = module_name[0 : module_name.find(".")]
-                m = import_module(root_module)
-                _global[m.__name__] = m
+        _global = {**modules}
 
         # add locals if any
         if locals:
@@ -321,24 +428,60 @@ class Module(Symbol, kw_only=True):
                 _global[key] = value
 
         # load symbol
-        for symbol in self.specification.symbols.all():
-            assert symbol.module
-            if not symbol.module.startswith("__"):
-                m = import_module(symbol.module)
-                _global[symbol.name] = getattr(m, symbol.name)
+        _global.update(symbols)
 
         _locals = {}
         exec(self.encodes(), _global, _locals)
         return _locals
 
+    def _import_environment(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Returns imported modules and symbols, cached until specification change."""
+        symbols = self.specification.symbols.all()
+        key = (
+            self.specification.get_all_modules(),
+            frozenset((symbol.module, symbol.name) for symbol in symbols),
+        )
+        caches = _caches(self)
+        environment = caches.get("_environment")
+        if environment is not None and environment[0] == key:
+            return environment[1], environment[2]
+
+        _modules = {**globals()}
+        for module_name in key[0]:
+            # import target module
+            _modules[module_name] = import_module(module_name)
+            # root module is already loaded by the import above
+            root_module, sep, _ = module_name.partition(".")
+            if sep:
+                _modules[root_module] = sys.modules[root_module]
+
+        # load symbol (their modules are already imported)
+        modules = sys.modules
+        _symbols = {}
+        for symbol in symbols:
+            assert symbol.module
+            _symbols[symbol.name] = getattr(modules[symbol.module], symbol.name)
+
+        caches["_environment"] = (key, _modules, _symbols)
+        return _modules, _symbols
+
 
 class Encoder:
     def __init__(self, output: TextIOBase, level: int = 0):
         self.output = output
         self.level = level
 
+    @property
+    def level(self) -> int:
+        return self._level
+
+    @level.setter
+    def level(self, value: int):
+        self._level = value
+        self._indent = " " * 4 * value
+
     def write(self, line: str) -> Encoder:
-        self.output.write(f"{' ' * 4 * self.level}{line}\n")
+        self.output.write(f"{self._indent}{line}\n")
         return self
 
     def __iadd__(self, line: str) -> Encoder:
@@ -354,14 +497,22 @@ class Encoder:
         return self
 
     def outdent(self) -> Encoder:
-        self.level -= 1
-        if self.level < 0:
-            self.level = 0
+        self.level = max(self.level - 1, 0)
         return self
 
     def write_lines(self, body: str) -> Encoder:
-        for line in body.split("\n"):
-            self.write(line)
+        indent = self._indent
+        # only split on new line: str.splitlines would also break string literals on form feed, etc...
+        self.output.write("".join(f"{indent}{line}\n" for line in body.split("\n")))
+        return self
+
+    def write_text(self, text: str) -> Encoder:
+        """Write a pre-rendered text, indenting its lines at current level."""
+        indent = self._indent
+        if indent:
+            # textwrap.indent would split on form feed, etc... like str.splitlines
+            text = "\n".join(f"{indent}{line}" if line.strip() else line for line in text.split("\n"))
+        self.output.write(text)
         return self
 
     def add_statement(self, statement: Statement) -> Encoder:
@@ -5,9 +5,9 @@ __all__ = ["get_builtin_type_names", "qualified_name"]
 
 
 @lru_cache
-def get_builtin_type_names() -> list[str]:
-    """returns a list of builtin type name."""
-    return [getattr(builtins, d).__name__ for d in dir(builtins) if isinstance(getattr(builtins, d), type)]
+def get_builtin_type_names() -> frozenset[str]:
+    """returns a set of builtin type name."""
+    return frozenset(v.__name__ for v in vars(builtins).values() if isinstance(v, type))
 
 
 def qualified_name(o) -> str:
@@ -41,3 +41,23 @@ async def call_them_all():
 def test_call_them_all():
     with Kernel() as k:
         k.run(call_them_all, shutdown=True)
+
+
+def test_kernel_asyncio_loop():
+    with Kernel() as k:
+        assert isinstance(k.asyncio_loop, asyncio.AbstractEventLoop)
+
+    with Kernel(with_asyncio=False) as k:
+        assert k.asyncio_loop is None
+
+
+@asyncio_context
+async def run_in_executor():
+    return await asyncio.get_running_loop().run_in_executor(None, threading.current_thread)
+
+
+def test_asyncio_executor_shutdown():
+    with Kernel(max_asyncio_workers=2) as k:
+        worker = k.run(run_in_executor, shutdown=True)
+    worker.join(timeout=5)
+    assert not worker.is_alive()
@@ -0,0 +1,64 @@
+import curio
+
+from sumps.aio import SENTINEL, iter
+
+
+async def consume(queue):
+    return [item async for item in iter(queue)]
+
+
+def test_iterable_queue():
+    async def main():
+        queue = curio.Queue()
+        for i in range(100):
+            await queue.put(i)
+        await queue.put(SENTINEL)
+        await queue.put(1000)
+        items = await consume(queue)
+        assert items == list(range(100))
+        # items after the terminator stay in the queue
+        assert queue.qsize() == 1
+
+    curio.run(main)
+
+
+def test_iterable_universal_queue():
+    async def main():
+        queue = curio.UniversalQueue()
+        for item in [0, "", None, 1]:
+            await queue.put(item)
+        await queue.put(SENTINEL)
+        assert await consume(queue) == [0, "", None, 1]
+        await curio.timeout_after(1, queue.join)
+
+    curio.run(main)
+
+
+def test_iterable_queue_batches():
+    async def main():
+        queue = curio.Queue()
+        for i in range(10):
+            await queue.put(i)
+        await queue.put(SENTINEL)
+        return [batch async for batch in iter(queue, batch_size=4).batches()]
+
+    assert curio.run(main) == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+def test_iterable_queue_halt():
+    async def main(batch_size):
+        queue = curio.Queue()
+        for i in range(10):
+            await queue.put(i)
+        iterable = iter(queue, batch_size=batch_size)
+        items = []
+        async for item in iterable:
+            items.append(item)
+            if item == 2:
+                await iterable.halt()
+        return items, queue.qsize()
+
+    # no prefetch by default
+    assert curio.run(main, 1) == ([0, 1, 2], 7)
+    # prefetched items are served before halting
+    assert curio.run(main, 4) == ([0, 1, 2, 3], 6)
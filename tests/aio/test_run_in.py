@@ -0,0 +1,47 @@
+import contextvars
+import os
+import zlib
+
+import curio
+
+from sumps.aio import run_in_process, run_in_thread
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def add(a, b):
+    return a + b, request_id.get()
+
+
+def test_run_in_thread():
+    assert curio.run(run_in_thread, add, 1, 2) == (3, None)
+
+
+def test_run_in_thread_with_context():
+    async def main():
+        token = request_id.set("abc")
+        try:
+            return await run_in_thread(add, 1, 2)
+        finally:
+            request_id.reset(token)
+
+    assert curio.run(main) == (3, "abc")
+
+
+def set_request_id():
+    request_id.set("leaked")
+
+
+def test_run_in_thread_does_not_leak_context():
+    async def main():
+        await run_in_thread(set_request_id)
+        return [(await run_in_thread(add, 1, 2))[1] for _ in range(4)]
+
+    # start from an empty context, nothing to propagate to the worker thread
+    assert contextvars.Context().run(curio.run, main) == [None] * 4
+
+
+def test_run_in_process_shared_memory():
+    payload = os.urandom(256 * 1024)
+    assert curio.run(run_in_process, zlib.crc32, payload) == zlib.crc32(payload)
+    assert curio.run(run_in_process, zlib.crc32, b"small") == zlib.crc32(b"small")
@@ -1,3 +1,8 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import sumps
 from sumps.ecs.entity import Component, EntityManager, Struct
 
 
@@ -11,6 +16,10 @@ class Position(Struct):
     y: int = 0
 
 
+class Health(Struct):
+    value: int = 100
+
+
 def qualified_name(c: type[Component]) -> str:
     return c.__name__
 
@@ -36,3 +45,99 @@ def test_entity_manager():
 
     e = em.get_entity(e2)
     assert e.velocity == Velocity(x=1.9, y=2.2)
+
+
+def test_entity_manager_archetypes():
+    em = EntityManager()
+    e1 = em.create_entity(Position(x=1, y=1))
+    e2 = em.create_entity(Position(x=2, y=2), Velocity(x=0.2, y=0.2))
+    e3 = em.create_entity(Position(x=3, y=3))
+
+    assert sorted(em.get_component(Position)) == [
+        (e1, Position(x=1, y=1)),
+        (e2, Position(x=2, y=2)),
+        (e3, Position(x=3, y=3)),
+    ]
+    assert list(em.get_components(Position, Velocity)) == [(e2, (Position(x=2, y=2), Velocity(x=0.2, y=0.2)))]
+
+    em.add_component(e1, Velocity(x=0.1, y=0.1))
+    assert em.component_for_entity(e3, Position) == Position(x=3, y=3)
+    assert sorted(e for e, _ in em.get_components(Position, Velocity)) == [e1, e2]
+
+    assert em.remove_component(e2, Velocity) == Velocity(x=0.2, y=0.2)
+    assert not em.has_component(e2, Velocity)
+    assert em.component_for_entity(e1, Velocity) == Velocity(x=0.1, y=0.1)
+
+    em.delete_entity(e1, immediate=True)
+    assert not em.entity_exists(e1)
+    assert em.components_for_entity(e3) == (Position(x=3, y=3),)
+    assert sorted(e for e, _ in em.get_component(Position)) == [e2, e3]
+
+    assert not list(em.get_components(Position, Health))
+    assert not list(EntityManager().get_component(Position))
+
+
+def test_entity_manager_try_components():
+    em = EntityManager()
+    e1 = em.create_entity(Position(x=1, y=1), Velocity(x=0.1, y=0.1))
+
+    assert em.has_components(e1, Position, Velocity)
+    assert not em.has_components(e1, Position, Health)
+
+    assert em.try_component(e1, Position) == Position(x=1, y=1)
+    assert em.try_component(e1, Health) is None
+
+    assert em.try_components(e1, Velocity, Position) == (Velocity(x=0.1, y=0.1), Position(x=1, y=1))
+    assert em.try_components(e1, Position, Health) is None
+
+
+def test_entity_manager_mutate_while_iterating():
+    em = EntityManager()
+    entities = [em.create_entity(Position(), Velocity()) for _ in range(5)]
+
+    seen = []
+    for entity, _ in em.get_components(Position, Velocity):
+        seen.append(entity)
+        em.add_component(entity, Health())
+    assert seen == entities
+
+    seen = []
+    for entity, _ in em.get_component(Health):
+        seen.append(entity)
+        em.remove_component(entity, Velocity)
+    assert sorted(seen) == entities
+    assert all(em.has_components(e, Position, Health) and not em.has_component(e, Velocity) for e in entities)
+
+
+_COMPONENTS_ORDER = """
+from sumps.ecs.entity import EntityManager, Struct
+
+class Velocity(Struct): pass
+class Position(Struct): pass
+class Health(Struct): pass
+class Mana(Struct): pass
+
+em = EntityManager()
+e = em.create_entity(Position(), Velocity(), Health(), Mana())
+print(",".join(type(c).__name__ for c in em.components_for_entity(e)))
+"""
+
+
+def test_entity_manager_components_order():
+    em = EntityManager()
+    e1 = em.create_entity(Velocity(), Position(), Health())
+    e2 = em.create_entity(Health(), Velocity(), Position())
+    assert em.components_for_entity(e1) == em.components_for_entity(e2) == (Health(), Position(), Velocity())
+
+    # order must not depend on string hashing
+    orders = {
+        subprocess.run(
+            [sys.executable, "-c", _COMPONENTS_ORDER],
+            env={"PYTHONHASHSEED": str(seed), "PYTHONPATH": str(Path(sumps.__file__).parents[1])},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        for seed in range(1, 6)
+    }
+    assert orders == {"Health,Mana,Position,Velocity"}
@@ -0,0 +1,31 @@
+import curio
+
+from sumps.func import closure
+
+
+@closure
+def add(a, b):
+    return a + b
+
+
+@closure
+async def async_add(a, b):
+    return a + b
+
+
+def test_closure():
+    fn = add(1, b=2)
+    assert fn() == 3
+    assert fn.__name__ == "add"
+    assert fn.__wrapped__ is add.__wrapped__
+    assert fn() == 3
+
+
+def test_closure_async():
+    async def main():
+        fn = await async_add(1, b=2)
+        assert curio.meta.iscoroutinefunction(fn)
+        assert fn.__name__ == "async_add"
+        return await fn()
+
+    assert curio.run(main) == 3
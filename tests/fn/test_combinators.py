@@ -0,0 +1,20 @@
+from sumps.func.combinators import memoized_z_fixed_point, z_fixed_point
+
+
+def test_z_fixed_point():
+    fact = z_fixed_point(lambda rec: lambda x: 1 if x == 0 else rec(x - 1) * x)
+    assert fact(5) == 120
+
+
+def test_memoized_z_fixed_point():
+    calls = []
+
+    def fib(rec):
+        def step(n):
+            calls.append(n)
+            return n if n < 2 else rec(n - 1) + rec(n - 2)
+
+        return step
+
+    assert memoized_z_fixed_point(fib)(30) == 832040
+    assert len(calls) == 31
@@ -1,5 +1,7 @@
 from inspect import signature
 
+import curio
+
 from sumps.func.compose import Compose, compose, pipe
 from sumps.func.identity import identity
 
@@ -42,7 +44,13 @@ def test_pipe():
 def test_signature():
     fn = compose(double, add)
     sig = str(signature(fn))
-    assert sig == "(a: 'int', b: 'int') -> 'int'"
+    assert sig == "(a: int, b: int) -> int"
+
+
+def test_compose_long_chain():
+    fn = compose(double, double, double, double, add)
+    assert fn(1, 1) == 65536
+    assert str(signature(fn)) == "(a: int, b: int) -> int"
 
 
 def test_compile():
@@ -50,3 +58,45 @@ def test_compile():
     assert fn(1, 2) == 9
     fn = Compose(funcs=[double, double]).compile()
     assert fn(2) == 16
+
+
+def test_compile_arguments():
+    def total(a, /, b, *args, c=0, **kwargs):
+        return a + b + sum(args) + c + sum(kwargs.values())
+
+    fn = Compose(funcs=[double, total]).compile()
+    assert fn(1, 2, 3, c=4, d=5) == 225
+
+
+def test_compile_lambdas():
+    inc = lambda x: x + 1  # noqa: E731
+    fn = Compose(funcs=[inc, inc, lambda x, y=10: x * y]).compile()
+    assert fn(2) == 22
+    assert fn(2, y=1) == 4
+
+
+def test_compose_without_signature():
+    assert Compose([str, max])(1, 2) == "2"
+
+
+def test_compose_cache():
+    assert compose(double, double, double, double, add) is compose(double, double, double, double, add)
+    assert compose(double, add) is not compose(add, double)
+    assert compose(abs, add) is compose(abs, add)
+
+    class Counter:
+        def inc(self, x):
+            return x + 1
+
+    counter = Counter()
+    assert compose(counter.inc, add) is not compose(counter.inc, add)
+    assert compose(counter.inc, add)(1, 2) == 4
+
+
+def test_compose_async():
+    async def increment(a: int) -> int:
+        return a + 1
+
+    fn = compose(double, increment, add)
+    assert str(signature(fn)) == "(a: int, b: int) -> int"
+    assert curio.run(fn, 1, 2) == 16
@@ -1,4 +1,6 @@
-from sumps.func.curried import curried
+from functools import partial
+
+from sumps.func.curried import _parameters_count, curried
 
 
 @curried
@@ -21,3 +23,15 @@ def test_curried_simple():
 
     assert plustwo(3, 1) == 6
     assert plustwo(2, 8) == 12
+
+
+def test_curried_keywords():
+    assert add_1(1, b=1)(c=1, d=1) == 4
+    assert add_1(1)(b=2)(c=1)(d=1) == 5
+
+
+def test_curried_parameters_count():
+    assert _parameters_count(lambda a, *args, b, **kwargs: None) == 4
+    assert _parameters_count(add_1) == 4
+    assert _parameters_count(partial(lambda a, b, c: None, 1)) == 2
+    assert _parameters_count(str.join) == 2
@@ -1,4 +1,8 @@
-from sumps.lang.symbols import Encoder, FunctionStatement, Module
+from inspect import signature
+
+import msgspec
+
+from sumps.lang.symbols import Encoder, FunctionStatement, Module, ModuleSpecification, Parameter
 
 
 def test_module():
@@ -20,3 +24,112 @@ def test_module_with_function():
     m.encode(output=output)
     # print(output.getvalue())
     assert output.getvalue()
+
+
+def test_function_signature_cache():
+    f = FunctionStatement(name="add", annotation=int)
+    f.add_parameter(name="a", annotation=int, default=0)
+    sig = f.signature()
+    assert f.signature() is sig
+
+    f.add_parameter(name="b", annotation=int, default=0)
+    assert f.signature() is not sig
+    assert list(f.signature().parameters) == ["a", "b"]
+
+    f.annotation = str
+    assert f.signature().return_annotation is str
+
+    f.parameters.add(Parameter(name="c", annotation=int, default=0))
+    assert list(f.signature().parameters) == ["a", "b", "c"]
+
+    g = FunctionStatement(name="add", annotation=str)
+    for name in ("a", "b", "c"):
+        g.add_parameter(name=name, annotation=int, default=0)
+    assert f == g
+
+    h = FunctionStatement(name="h", body="return a")
+    h.add_parameter(name="a")
+    h.signature()
+    assert b"_signature" not in msgspec.json.encode(h)
+
+
+def test_specification_all_modules():
+    spec = ModuleSpecification()
+    assert spec.get_all_modules() == set()
+
+    spec.add_symbol(qualified_name="collections.abc.Callable")
+    assert spec.get_all_modules() == {"collections.abc"}
+    assert isinstance(spec.get_all_modules(), frozenset)
+    assert spec == ModuleSpecification(symbols=spec.symbols)
+
+
+def test_function_format_signature():
+    def sample(a, /, b: int, c="x", *, d: str = "") -> int:
+        return 0
+
+    f = FunctionStatement(name="sample")
+    f.set_signature(signature(sample))
+    assert f._format_signature() == str(f.signature())
+
+    def variadic(a, *args: int, b=1, **kwargs) -> None:
+        pass
+
+    f.set_signature(signature(variadic))
+    assert f._format_signature() == str(signature(variadic))
+
+
+def test_module_import_environment():
+    m = Module(name="test")
+    f = FunctionStatement(name="add", annotation=int)
+    f.add_parameter(name="a", annotation=int, default=0)
+    f.add_parameter(name="b", annotation=int, default=0)
+    f.body = "return a + b"
+    f.register(module=m)
+
+    assert m.import_module()["add"](1, 2) == 3
+    environment = m._environment
+    assert m.import_module()["add"](2, 2) == 4
+    assert m._environment is environment
+    assert "_environment" not in Module.__struct_fields__
+
+    m.specification.add_symbol(qualified_name="collections.abc.Callable")
+    assert "Callable" in m._import_environment()[1]
+    assert m._environment is not environment
+
+
+def test_module_encodes_cache():
+    m = Module(name="test")
+    f = FunctionStatement(name="one", body="return 1")
+    f.register(module=m)
+
+    source = m.encodes()
+    assert m.encodes() is source
+
+    f.body = "return 2"
+    assert "return 2" in m.encodes()
+
+    m.specification.add_symbol(qualified_name="collections.abc.Callable")
+    assert "from collections.abc import Callable" in m.encodes()
+
+    f.parameters.add(Parameter(name="a"))
+    assert "def one(a: None = None) -> None:" in f.render()
+    assert "def one(a: None = None) -> None:" in m.encodes()
+
+    g, h = FunctionStatement(name="two"), FunctionStatement(name="two")
+    g.render()
+    assert g == h
+    assert b"_rendered" not in msgspec.json.encode(g)
+
+
+def test_encoder_lines():
+    output = Encoder.encoder()
+    output.level = 1
+    output.write_lines('return "a\x0cb"\n')
+    assert output.getvalue() == '    return "a\x0cb"\n    \n'
+    output.write_text('x = "a\x0cb"\n')
+    assert output.getvalue().endswith('    x = "a\x0cb"\n')
+
+    m = Module(name="test")
+    f = FunctionStatement(name="form_feed", body='return "a\x0cb"')
+    f.register(module=m)
+    assert m.import_module()["form_feed"]() == "a\x0cb"